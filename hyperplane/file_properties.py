@@ -18,15 +18,24 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 """Miscellaneous variables for determining file properties."""
+import sys
 
 from gi.repository import Gio, GLib
 
-DOT_IS_NOT_EXTENSION = {
-    "application/x-sharedlib",
-    "application/x-executable",
-    "application/x-pie-executable",
-    "inode/symlink",
-}
+# Read-only, checked once per entry in directory listings.
+# Interning the entries lets membership tests hit the
+# pointer-equality fast path for interned content types.
+DOT_IS_NOT_EXTENSION = frozenset(
+    map(
+        sys.intern,
+        (
+            "application/x-sharedlib",
+            "application/x-executable",
+            "application/x-pie-executable",
+            "inode/symlink",
+        ),
+    )
+)
 
 
 # This is so nonexistent URIs never match
@@ -38,6 +38,7 @@ from hyperplane.utils.create_alert_dialog import create_alert_dialog
 from hyperplane.utils.dates import relative_date
 from hyperplane.utils.files import (
     YouAreStupid,
+    cached_is_dir,
     copy,
     execute,
     get_gfile_display_name,
@@ -78,7 +79,13 @@ class HypItemsPage(Adw.NavigationPage):
     ) -> None:
         super().__init__(**kwargs)
         self.gfile = gfile
+        # The URI never changes, so serialize it once instead of
+        # calling get_uri() for every comparison
+        self.uri = gfile.get_uri() if gfile else None
         self.tags = tags
+        # Tags in canonical order, so two pages representing
+        # the same tags compare equal regardless of click order
+        self.tag_key = tuple(sorted(tags)) if tags else None
         self.items = {}
         self.list_items = {}
 
@@ -187,13 +194,13 @@ class HypItemsPage(Adw.NavigationPage):
 
         # What page to show if there are no items
         if self.gfile:
-            if self.gfile.get_uri() == SpecialUris.trash_uri:
+            if self.uri == SpecialUris.trash_uri:
                 self.no_items_page = self.empty_trash
 
-            elif self.gfile.get_uri() == SpecialUris.recent_uri:
+            elif self.uri == SpecialUris.recent_uri:
                 self.no_items_page = self.no_recents
 
-            elif self.gfile.get_uri() == SpecialUris.downloads_uri:
+            elif self.uri == SpecialUris.downloads_uri:
                 self.no_items_page = self.no_downloads
 
             else:
@@ -331,7 +338,8 @@ class HypItemsPage(Adw.NavigationPage):
     def get_dst(self) -> Gio.File:
         """Gets the destination `GFile` for paste operations to the page."""
         if self.tags:
-            tags = tuple(tag for tag in shared.tags if tag in self.tags)
+            page_tags = set(self.tags)
+            tags = tuple(tag for tag in shared.tags if tag in page_tags)
             return Gio.File.new_for_path(
                 str(
                     Path(
@@ -754,6 +762,7 @@ class HypItemsPage(Adw.NavigationPage):
             emit = self.tags and (not new_gfile.get_parent().query_exists())
 
             new_gfile.make_directory_with_parents()
+            cached_is_dir.cache_clear()
             dialog.close()
 
             if not emit:
@@ -770,21 +779,27 @@ class HypItemsPage(Adw.NavigationPage):
 
         dialog.choose(self.get_root())
 
-    def __copy(self, *_args: Any) -> None:
+    def __copy(self, *_args: Any, gfiles: Optional[list[Gio.File]] = None) -> None:
         shared.set_cut_uris(set())
         clipboard = Gdk.Display.get_default().get_clipboard()
-        if not (items := self.get_selected_gfiles()):
+
+        if gfiles is None:
+            gfiles = self.get_selected_gfiles()
+
+        if not gfiles:
             return
 
-        provider = Gdk.ContentProvider.new_for_value(Gdk.FileList.new_from_array(items))
+        provider = Gdk.ContentProvider.new_for_value(
+            Gdk.FileList.new_from_array(gfiles)
+        )
 
         clipboard.set_content(provider)
 
-    def __cut(self, _obj: Any, *args: Any) -> None:
-        self.__copy(*args)
-        shared.set_cut_uris(
-            set(gfile.get_uri() for gfile in self.get_selected_gfiles())
-        )
+    def __cut(self, *_args: Any) -> None:
+        gfiles = self.get_selected_gfiles()
+
+        self.__copy(gfiles=gfiles)
+        shared.set_cut_uris(set(gfile.get_uri() for gfile in gfiles))
 
     def __paste(self, *_args: Any) -> None:
         clipboard = Gdk.Display.get_default().get_clipboard()
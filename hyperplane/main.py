@@ -39,6 +39,7 @@ from hyperplane.file_manager_dbus import FileManagerDBusServer
 from hyperplane.guide import HypGuide
 from hyperplane.logging.logging_config import logging_config
 from hyperplane.preferences import HypPreferencesDialog
+from hyperplane.utils.tags import flush_tags
 from hyperplane.window import HypWindow
 
 
@@ -176,6 +177,13 @@ class HypApplication(Adw.Application):
 
         return win
 
+    def do_shutdown(self) -> None:
+        """Called when the application is shutting down."""
+        # Make sure no coalesced tag write is lost
+        flush_tags()
+
+        Adw.Application.do_shutdown(self)
+
     def do_handle_local_options(self, options: GLib.VariantDict) -> int:
         """Handles local command line arguments."""
         self.register()  # This is so get_is_remote works
@@ -74,14 +74,12 @@ class HypNavigationBin(Adw.Bin):
         next_page = self.next_pages[-1] if self.next_pages else None
 
         if gfile:
-            if page.gfile and page.gfile.get_uri() == gfile.get_uri():
+            uri = gfile.get_uri()
+
+            if page.uri == uri:
                 return
 
-            if (
-                next_page
-                and next_page.gfile
-                and next_page.gfile.get_uri() == gfile.get_uri()
-            ):
+            if next_page and next_page.uri == uri:
                 self.view.push(next_page)
                 return
 
@@ -89,11 +87,12 @@ class HypNavigationBin(Adw.Bin):
         # Prefer tags over tag because of HypPathSegment, which has both
         elif tags:
             tags = list(tags)
+            tag_key = tuple(sorted(tags))
 
-            if page.tags == tags:
+            if page.tag_key == tag_key:
                 return
 
-            if next_page and next_page.tags == tags:
+            if next_page and next_page.tag_key == tag_key:
                 self.view.push(next_page)
                 return
 
@@ -103,13 +102,11 @@ class HypNavigationBin(Adw.Bin):
                 if tag in page.tags:
                     return
 
-                tags = page.tags.copy()
+                tags = [*page.tags, tag]
             else:
-                tags = []
-
-            tags.append(tag)
+                tags = [tag]
 
-            if next_page and next_page.tags == tags:
+            if next_page and next_page.tag_key == tuple(sorted(tags)):
                 self.view.push(next_page)
                 return
 
@@ -123,8 +120,17 @@ class HypNavigationBin(Adw.Bin):
     def __pushed(self, *_args: Any) -> None:
         page = self.view.get_visible_page()
 
+        def focus_cb() -> bool:
+            # Only grab focus if no newer navigation happened in the meantime
+            if self.view.get_visible_page() == page:
+                self.get_root().set_focus(page.scrolled_window)
+
+            return GLib.SOURCE_REMOVE
+
         # HACK: find a proper way of doing this
-        GLib.timeout_add(10, self.get_root().set_focus, page.scrolled_window)
+        # An idle callback at high priority instead of a timeout,
+        # so the hand-off doesn't add a fixed delay but drawing still wins
+        GLib.idle_add(focus_cb, priority=GLib.PRIORITY_HIGH_IDLE + 20)
 
         if not self.next_pages:
             return
@@ -19,6 +19,7 @@
 
 """The path bar in a HypWindow."""
 import logging
+from functools import lru_cache
 from os import sep
 from pathlib import Path
 from typing import Any, Iterable, Optional
@@ -30,6 +31,27 @@ from hyperplane import shared
 from hyperplane.path_segment import HypPathSegment
 
 
+@lru_cache(maxsize=32)
+def _parse_uri(uri: str) -> tuple[str, str]:
+    """Returns the scheme and unquoted path of `uri`, caching the result."""
+
+    # The overwhelmingly common case, no need for a full urlparse
+    if uri.startswith("file://"):
+        return "file", unquote(uri[7:])
+
+    parse = urlparse(uri)
+    return parse.scheme, unquote(parse.path)
+
+
+# Resolved (base_name, base_symbolic, base_uri) triples for remote roots,
+# populated asynchronously and cleared whenever mounts change
+_scheme_root_infos: dict[str, tuple[str, str, str]] = {}
+
+_volume_monitor = Gio.VolumeMonitor.get()
+_volume_monitor.connect("mount-added", lambda *_: _scheme_root_infos.clear())
+_volume_monitor.connect("mount-removed", lambda *_: _scheme_root_infos.clear())
+
+
 @Gtk.Template(resource_path=shared.PREFIX + "/gtk/path-bar.ui")
 class HypPathBar(Gtk.ScrolledWindow):
     """The path bar in a HypWindow."""
@@ -40,7 +62,6 @@ class HypPathBar(Gtk.ScrolledWindow):
     segments_box: Gtk.Box = Gtk.Template.Child()
 
     segments: list
-    separators: dict
     tags: bool  # Whether the path bar represents tags or a file
 
     def __init__(self, **kwargs) -> None:
@@ -50,9 +71,22 @@ class HypPathBar(Gtk.ScrolledWindow):
         self.set_cursor(Gdk.Cursor.new_from_name("text"))
 
         self.segments = []
-        self.separators = {}
         self.tags = False
 
+        # One hash per displayed segment, folded over all of its ancestors,
+        # so update() can find the divergence point with integer compares
+        self._segment_hashes = []
+
+        # Widgets awaiting removal once their hide animation has played
+        self._pending_removals = []
+        self._removal_scheduled = False
+
+        # Cancellable for an in-flight remote root lookup
+        self._pending_query = None
+
+        # Source ID of the pending scroll to the last appended segment
+        self._scroll_source = None
+
         # Left-click
         self.segment_clicked = False
         left_click = Gtk.GestureClick(button=Gdk.BUTTON_PRIMARY)
@@ -66,24 +100,13 @@ class HypPathBar(Gtk.ScrolledWindow):
         for _index in range(n):
             child = self.segments.pop()
             child.set_reveal_child(False)
-            GLib.timeout_add(
-                child.get_transition_duration(),
-                self.__remove_child,
-                self.segments_box,
-                child,
-            )
+            self.__schedule_removal(child)
 
-            if not (separator := self.separators[child]):
+            if not (separator := child.separator):
                 return
 
             separator.set_reveal_child(False)
-            GLib.timeout_add(
-                separator.get_transition_duration(),
-                self.__remove_child,
-                self.segments_box,
-                separator,
-            )
-            self.separators.pop(child)
+            self.__schedule_removal(separator)
 
         if self.tags:
             return
@@ -127,14 +150,21 @@ class HypPathBar(Gtk.ScrolledWindow):
         segment.set_transition_type(Gtk.RevealerTransitionType.SLIDE_RIGHT)
         segment.set_reveal_child(True)
 
-        self.separators[segment] = separator
+        # Keep the separator on the segment itself so removal
+        # doesn't need to hash GObjects for a dict lookup
+        segment.separator = separator
         self.segments.append(segment)
 
         last_segment = self.segments[-1]
 
-        GLib.timeout_add(
+        # Only the scroll to the last appended segment matters,
+        # so replace any still-pending one
+        if self._scroll_source:
+            GLib.source_remove(self._scroll_source)
+
+        self._scroll_source = GLib.timeout_add(
             last_segment.get_transition_duration(),
-            self.viewport.scroll_to,
+            self.__scroll_to,
             last_segment,
         )
 
@@ -154,10 +184,27 @@ class HypPathBar(Gtk.ScrolledWindow):
             self.segments_box.remove(child)
 
         self.segments = []
-        self.separators = {}
+        self._segment_hashes = []
+
+    def update(
+        self,
+        gfile: Optional[Gio.File],
+        tags: Optional[Iterable[str]],
+        root_info: Optional[tuple[str, str, str]] = None,
+    ) -> None:
+        """
+        Updates the bar according to a new `gfile` or new `tags`.
+
+        `root_info` is a freshly resolved (name, icon, URI) triple
+        for the root of a remote `gfile`, used instead of the cache.
+        """
+
+        # Any navigation makes an in-flight remote root lookup stale,
+        # so don't let its callback overwrite the bar later
+        if self._pending_query:
+            self._pending_query.cancel()
+            self._pending_query = None
 
-    def update(self, gfile: Optional[Gio.File], tags: Optional[Iterable[str]]) -> None:
-        """Updates the bar according to a new `gfile` or new `tags`."""
         if gfile:
             if self.tags:
                 self.purge()
@@ -165,69 +212,48 @@ class HypPathBar(Gtk.ScrolledWindow):
             self.tags = False
 
             uri = gfile.get_uri()
-            parse = urlparse(uri)
+            scheme, uri_path = _parse_uri(uri)
             segments = []
-            scheme_uri = f"{parse.scheme}://"
+            scheme_uri = f"{scheme}://"
 
             # Do these automatically if shceme != "file"
-            if parse.scheme == "file":
+            if scheme == "file":
                 base_uri = scheme_uri
             else:
-                try:
-                    file_info = Gio.File.new_for_uri(scheme_uri).query_info(
-                        ",".join(
-                            (
-                                Gio.FILE_ATTRIBUTE_STANDARD_SYMBOLIC_ICON,
-                                Gio.FILE_ATTRIBUTE_STANDARD_DISPLAY_NAME,
-                            )
-                        ),
-                        Gio.FileQueryInfoFlags.NONE,
-                    )
-
-                    base_name = file_info.get_display_name()
-                    base_symbolic = file_info.get_symbolic_icon().get_names()[0]
+                if root_info := root_info or _scheme_root_infos.get(scheme_uri):
+                    base_name, base_symbolic, base_uri = root_info
+                else:
+                    # Show a placeholder root and resolve the real one
+                    # asynchronously so remote schemes don't block the UI
+                    base_name = scheme_uri
+                    base_symbolic = "folder-remote-symbolic"
                     base_uri = scheme_uri
-                except GLib.Error:
-                    # Try the mount if the scheme root fails
-                    try:
-                        mount = gfile.find_enclosing_mount()
-                        mount_gfile = mount.get_default_location()
-
-                        base_name = mount.get_name()
-                        base_symbolic = mount.get_symbolic_icon().get_names()[0]
-                        base_uri = mount_gfile.get_uri()
-                    except GLib.Error as error:
-                        base_name = None
-                        base_symbolic = None
-                        base_uri = None
-                        logging.error(
-                            'Cannot get information for location "%s": %s', uri, error
-                        )
-
-            parts = unquote(parse.path).split(sep)
-
-            for index, part in enumerate(parts):
+                    self.__query_scheme_root(scheme_uri, gfile)
+
+            # Build the ancestor URIs with a running accumulator
+            # instead of re-joining every prefix
+            current_uri = base_uri
+            for part in uri_path.split(sep):
                 if not part:
                     continue
 
-                segments.append(
-                    (part, "", f"{base_uri}{sep.join(parts[:index+1])}", None)
-                )
+                current_uri = f"{current_uri}{sep}{part}"
+                segments.append((part, "", current_uri, None))
 
             if (path := gfile.get_path()) and (
-                (path := Path(path)) == shared.home_path
-                or path.is_relative_to(shared.home_path)
+                path == shared.home_path_str
+                or path.startswith(shared.home_path_prefix)
             ):
-                segments = segments[len(shared.home_path.parts) - 1 :]
+                segments = segments[shared.home_parts_len - 1 :]
                 base_name = _("Home")
                 base_symbolic = "user-home-symbolic"
-                base_uri = shared.home.get_uri()
-            elif parse.scheme == "file":
+                base_uri = shared.home_uri
+            elif scheme == "file":
                 # Not relative to home, so add a root segment
                 base_name = ""
                 base_symbolic = "drive-harddisk-symbolic"
                 # Fall back to sep if the GFile doesn't have a path
-                base_uri = Path(path.anchor if path else sep).as_uri()
+                base_uri = Path(Path(path).anchor if path else sep).as_uri()
 
             if base_uri:
                 segments.insert(
@@ -248,33 +274,141 @@ class HypPathBar(Gtk.ScrolledWindow):
 
             segments = tuple((tag, "", None, tag) for tag in tags)
 
-        if (old_len := len(self.segments)) > (new_len := len(segments)):
-            self.remove(old_len - new_len)
+        # Fold a hash over each segment's ancestors so finding
+        # the common prefix is an integer compare per level
+        new_hashes = []
+        level_hash = 0
+        for new_segment in segments:
+            level_hash = hash((level_hash, new_segment))
+            new_hashes.append(level_hash)
+
+        divergence = 0
+        for old_hash, new_hash in zip(self._segment_hashes, new_hashes):
+            if old_hash != new_hash:
+                break
+
+            divergence += 1
+
+        if (outdated := len(self.segments) - divergence) > 0:
+            self.remove(outdated)
+
+        for new_segment in segments[divergence:]:
+            self.append(*new_segment)
+
+        self._segment_hashes = new_hashes
+
+    def __query_scheme_root(self, scheme_uri: str, gfile: Gio.File) -> None:
+        # Look up the display info for a remote root without blocking the
+        # main loop, then redraw the bar once it is known
+        self._pending_query = cancellable = Gio.Cancellable()
+
+        def finish(root_info: tuple[str, str, str], cache: bool = True) -> None:
+            if cache:
+                _scheme_root_infos[scheme_uri] = root_info
+
+            if cancellable.is_cancelled():
+                return
+
+            self._pending_query = None
+            self.update(gfile, None, root_info=root_info)
 
-        append = False
-        for index, new_segment in enumerate(segments):
+        def mount_cb(source: Gio.File, result: Gio.AsyncResult) -> None:
             try:
-                old_segment = self.segments[index]
-            except IndexError:
-                old_segment = None
-
-            if (
-                not append
-                and old_segment
-                and new_segment[2] == old_segment.uri
-                and new_segment[3] == old_segment.tag
-            ):
+                mount = source.find_enclosing_mount_finish(result)
+            except GLib.Error as error:
+                if not cancellable.is_cancelled():
+                    logging.error(
+                        'Cannot get information for location "%s": %s',
+                        gfile.get_uri(),
+                        error,
+                    )
+                return
+
+            # The mount depends on the concrete file, not just the scheme,
+            # so its info mustn't be reused for every location of the scheme
+            finish(
+                (
+                    mount.get_name(),
+                    mount.get_symbolic_icon().get_names()[0],
+                    mount.get_default_location().get_uri(),
+                ),
+                cache=False,
+            )
+
+        def query_cb(source: Gio.File, result: Gio.AsyncResult) -> None:
+            try:
+                file_info = source.query_info_finish(result)
+            except GLib.Error:
+                if cancellable.is_cancelled():
+                    return
+
+                # Try the mount if the scheme root fails
+                gfile.find_enclosing_mount_async(
+                    GLib.PRIORITY_DEFAULT, cancellable, mount_cb
+                )
+                return
+
+            finish(
+                (
+                    file_info.get_display_name(),
+                    file_info.get_symbolic_icon().get_names()[0],
+                    scheme_uri,
+                )
+            )
+
+        Gio.File.new_for_uri(scheme_uri).query_info_async(
+            ",".join(
+                (
+                    Gio.FILE_ATTRIBUTE_STANDARD_SYMBOLIC_ICON,
+                    Gio.FILE_ATTRIBUTE_STANDARD_DISPLAY_NAME,
+                )
+            ),
+            Gio.FileQueryInfoFlags.NONE,
+            GLib.PRIORITY_DEFAULT,
+            cancellable,
+            query_cb,
+        )
+
+    def __scroll_to(self, segment: HypPathSegment) -> bool:
+        self._scroll_source = None
+        self.viewport.scroll_to(segment)
+
+        return GLib.SOURCE_REMOVE
+
+    def __schedule_removal(self, child: Gtk.Widget) -> None:
+        # Coalesce a whole batch of removals into a single timeout
+        # instead of waking the main loop once per widget
+        self._pending_removals.append(child)
+
+        if self._removal_scheduled:
+            return
+
+        self._removal_scheduled = True
+        GLib.timeout_add(child.get_transition_duration(), self.__drain_removals)
+
+    def __drain_removals(self) -> bool:
+        remaining = []
+        for child in self._pending_removals:
+            # Children from a later batch may still be sliding out;
+            # keep those pending and come back for them
+            # (a child unparented by purge() never finishes animating)
+            if child.get_child_revealed() and child.get_parent():
+                remaining.append(child)
                 continue
 
-            if not append:
-                self.remove(len(self.segments) - index)
-                append = True
+            self.__remove_child(self.segments_box, child)
 
-            self.append(*new_segment)
+        self._pending_removals = remaining
+
+        if remaining:
+            return GLib.SOURCE_CONTINUE
+
+        self._removal_scheduled = False
+        return GLib.SOURCE_REMOVE
 
     def __remove_child(self, parent: Gtk.Box, child: Gtk.Widget) -> None:
         # This is so GTK doesn't freak out when the child isn't in the parent anymore
-        if child.get_parent == parent:
+        if child.get_parent() is parent:
             parent.remove(child)
 
     def __left_click(self, *_args: Any) -> None:
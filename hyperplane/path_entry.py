@@ -157,11 +157,8 @@ class HypPathEntry(Gtk.Entry):
         text = entry.get_text().strip()
 
         if text.startswith("//"):
-            tags = list(
-                tag
-                for tag in shared.tags
-                if tag in text.lstrip("/").rstrip("/").split("//")
-            )
+            typed_tags = set(text.lstrip("/").rstrip("/").split("//"))
+            tags = list(tag for tag in shared.tags if tag in typed_tags)
 
             if not tags:
                 self.get_root().send_toast(_("No such tags"))
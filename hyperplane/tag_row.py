@@ -24,7 +24,7 @@ from gi.repository import Gdk, Gtk
 
 from hyperplane import shared
 from hyperplane.editable_row import HypEditableRow
-from hyperplane.utils.tags import update_tags
+from hyperplane.utils.tags import move_tag_to
 
 
 class HypTagRow(HypEditableRow):
@@ -92,17 +92,15 @@ class HypTagRow(HypEditableRow):
         self.remove_css_class("sidebar-drop-target")
 
     def __drop(self, _target: Gtk.DropTarget, row: Self, _x: float, _y: float) -> None:
-        self_index = shared.tags.index(self.tag)
-        row_index = shared.tags.index(row.tag)
+        self_index = shared.tag_index[self.tag]
+        row_index = shared.tag_index[row.tag]
 
-        shared.tags.insert(
+        move_tag_to(
+            row.tag,
             # Offset the index by 1 if `row.tag` is at a larger index than `self.tag`
             self_index + int(self_index < row_index),
-            shared.tags.pop(row_index),
         )
 
-        update_tags()
-
     def __right_click(
         self, _gesture: Gtk.GestureClick, _n: int, x: float, y: float
     ) -> None:
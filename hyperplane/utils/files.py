@@ -20,6 +20,7 @@
 """Miscellaneous utilities for file operations."""
 import logging
 import shutil
+from functools import lru_cache
 from itertools import count
 from os import PathLike, getenv
 from pathlib import Path
@@ -39,6 +40,18 @@ class YouAreStupid(Exception):
     """Raised when you try to move a folder into itself."""
 
 
+@lru_cache(maxsize=256)
+def cached_is_dir(path_str: str) -> bool:
+    """
+    Checks whether `path_str` is a directory, caching the result.
+
+    This avoids repeated `stat()` calls in hot paths such as validating
+    a file name on every keystroke. The cache is cleared whenever the app
+    itself creates, moves, renames or removes files.
+    """
+    return Path(path_str).is_dir()
+
+
 def copy(src: Gio.File, dst: Gio.File, callback: Optional[Callable] = None) -> None:
     """
     Asynchronously copies a file or directory from `src` to `dst`.
@@ -71,6 +84,8 @@ def copy(src: Gio.File, dst: Gio.File, callback: Optional[Callable] = None) -> N
                 )
                 return
 
+            cached_is_dir.cache_clear()
+
             if tag_location_created:
                 __emit_tags_changed(dst)
 
@@ -104,15 +119,21 @@ def copy(src: Gio.File, dst: Gio.File, callback: Optional[Callable] = None) -> N
     def path_copy_cb(_task: Gio.Task, _res: Gio.Task) -> None:
         # TODO: Figure out error handling here?
 
+        cached_is_dir.cache_clear()
+
         if tag_location_created:
             __emit_tags_changed(dst)
 
         if callback:
             callback()
 
-    Gio.Task.new(callback=path_copy_cb).run_in_thread(
-        lambda *_: __copy_path(src_path, dst_path)
-    )
+    def copy_path_thread(task: Gio.Task, *_args) -> None:
+        __copy_path(src_path, dst_path)
+
+        # The task only dispatches path_copy_cb if it is returned through
+        task.return_boolean(True)
+
+    Gio.Task.new(callback=path_copy_cb).run_in_thread(copy_path_thread)
 
 
 def move(src: Gio.File, dst: Gio.File) -> None:
@@ -141,6 +162,8 @@ def move(src: Gio.File, dst: Gio.File) -> None:
             logging.error('Cannot create parents for "%s": %s', dst.get_uri(), error)
             return
 
+        cached_is_dir.cache_clear()
+
     def emit_tags_changed() -> None:
         if (
             (path := dst.get_path())
@@ -172,6 +195,7 @@ def move(src: Gio.File, dst: Gio.File) -> None:
                 )
                 return
         else:
+            cached_is_dir.cache_clear()
             emit_tags_changed()
 
     src.move_async(
@@ -319,8 +343,15 @@ def rm(gfile: Gio.File) -> None:
 
             __remove_trashinfo(gfile, orig_path)
 
+        def rmtree_thread(_task: Gio.Task, *_args) -> None:
+            shutil.rmtree(path, ignore_errors=True)
+
+            # Clear right here since lru_cache is thread-safe and nothing
+            # returns through the task, so its callback would never run
+            cached_is_dir.cache_clear()
+
         # Gio doesn't allow for recursive deletion
-        Gio.Task.new().run_in_thread(lambda *_: shutil.rmtree(path, ignore_errors=True))
+        Gio.Task.new().run_in_thread(rmtree_thread)
     else:
         gfile.delete_async(GLib.PRIORITY_DEFAULT)
 
@@ -430,7 +461,7 @@ def validate_name(
         return False, _("The path is not writable.")
 
     if siblings:
-        is_dir = path.is_dir()
+        is_dir = cached_is_dir(str(path))
         is_file = (not is_dir) and (path.exists())
     else:
         is_dir = directory
@@ -451,7 +482,7 @@ def validate_name(
         return False, error
 
     new_path = Path(path.parent, name) if siblings else path / name
-    new_is_dir = new_path.is_dir()
+    new_is_dir = cached_is_dir(str(new_path))
     new_is_file = (not new_is_dir) and (new_path.exists())
 
     if new_is_dir and is_dir and new_path != path:
@@ -472,11 +503,30 @@ def validate_name(
     return True, None
 
 
-def trash(*gfiles: Gio.File) -> None:
-    """Tries to asynchronously trash `gfiles`."""
+def trash(*gfiles: Gio.File, callback: Optional[Callable] = None) -> None:
+    """
+    Tries to asynchronously trash `gfiles`.
+
+    Calls `callback` once every file has finished trashing.
+    """
+    pending = len(gfiles)
+
+    def trash_cb(gfile: Gio.File, result: Gio.AsyncResult) -> None:
+        nonlocal pending
+
+        try:
+            gfile.trash_finish(result)
+        except GLib.Error as error:
+            logging.error('Cannot trash file "%s": %s', gfile.get_uri(), error)
+        else:
+            cached_is_dir.cache_clear()
+
+        pending -= 1
+        if (not pending) and callback:
+            callback()
 
     for gfile in gfiles:
-        gfile.trash_async(GLib.PRIORITY_DEFAULT)
+        gfile.trash_async(GLib.PRIORITY_DEFAULT, None, trash_cb)
 
 
 def __copy_path(src: PathLike | str, dst: PathLike | str) -> None:
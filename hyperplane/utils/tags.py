@@ -18,13 +18,16 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 """Miscellaneous utilities for working with tags."""
-from os import PathLike
+from os import PathLike, sep
 from pathlib import Path
+from typing import Optional
 
-from gi.repository import Gtk
+from gi.repository import GLib, Gtk
 
 from hyperplane import shared
 
+_pending_change: Optional[Gtk.FilterChange] = None
+
 
 def update_tags(change: Gtk.FilterChange = Gtk.FilterChange.DIFFERENT) -> None:
     """
@@ -32,7 +35,32 @@ def update_tags(change: Gtk.FilterChange = Gtk.FilterChange.DIFFERENT) -> None:
 
     `change` indicates whether tags were
     added (more strict), removed (less strict) or just reordered (different).
+
+    Bursts of mutations are coalesced into a single write and signal
+    emission from an idle callback.
     """
+    global _pending_change  # pylint: disable=global-statement
+
+    if _pending_change is None:
+        _pending_change = change
+        GLib.idle_add(__flush_tags_cb, priority=GLib.PRIORITY_LOW)
+        return
+
+    if _pending_change != change:
+        # Mixed additions and removals need a full re-evaluation
+        _pending_change = Gtk.FilterChange.DIFFERENT
+
+
+def flush_tags() -> None:
+    """Writes any pending tag changes to disk and notifies widgets immediately."""
+    global _pending_change  # pylint: disable=global-statement
+
+    if _pending_change is None:
+        return
+
+    change = _pending_change
+    _pending_change = None
+
     (shared.home_path / ".hyperplane").write_text(
         "\n".join(shared.tags), encoding="utf-8"
     )
@@ -40,17 +68,23 @@ def update_tags(change: Gtk.FilterChange = Gtk.FilterChange.DIFFERENT) -> None:
     shared.postmaster.emit("tags-changed", change)
 
 
+def __flush_tags_cb() -> bool:
+    flush_tags()
+    return GLib.SOURCE_REMOVE
+
+
 def path_represents_tags(path: PathLike | str) -> bool:
     """Checks whether a given `path` represents tags or not."""
-    path = Path(path)
+    path_str = str(Path(path))
 
-    if path == shared.home_path:
+    # Also false when `path` is home itself, since then there is no tail
+    if not path_str.startswith(shared.home_path_prefix):
         return False
 
-    if not path.is_relative_to(shared.home_path):
-        return False
-
-    return all(part in shared.tags for part in path.relative_to(shared.home_path).parts)
+    return all(
+        part in shared.tags_set
+        for part in path_str[len(shared.home_path_prefix) :].split(sep)
+    )
 
 
 def add_tags(*tags: str) -> None:
@@ -61,17 +95,32 @@ def add_tags(*tags: str) -> None:
     """
     for tag in tags:
         shared.tags.append(tag)
+        shared.tags_set.add(tag)
+        shared.tag_index[tag] = len(shared.tags) - 1
     update_tags(Gtk.FilterChange.MORE_STRICT)
 
 
 def remove_tags(*tags: str) -> None:
     """Removes tags and updates the list of tags."""
     for tag in tags:
-        if tag in shared.tags:
+        if tag in shared.tags_set:
             shared.tags.remove(tag)
+            shared.tags_set.discard(tag)
+
+    # Removal shifts every tag after the removed one
+    shared.tag_index = {tag: index for index, tag in enumerate(shared.tags)}
     update_tags(Gtk.FilterChange.LESS_STRICT)
 
 
+def move_tag_to(tag: str, index: int) -> None:
+    """Moves `tag` to `index` in the list of tags."""
+    shared.tags.insert(index, shared.tags.pop(shared.tag_index[tag]))
+
+    # The move shifts every tag between the old and new position
+    shared.tag_index = {tag: index for index, tag in enumerate(shared.tags)}
+    update_tags()
+
+
 def move_tag(tag: str, up: bool) -> None:
     """Moves a tag up or down by one in the list of tags."""
 
@@ -81,12 +130,14 @@ def move_tag(tag: str, up: bool) -> None:
         if shared.tags[0] == tag:
             return
 
-        index = shared.tags.index(tag)
+        index = shared.tag_index[tag]
 
         shared.tags[index], shared.tags[index - 1] = (
             shared.tags[index - 1],
             shared.tags[index],
         )
+        shared.tag_index[shared.tags[index]] = index
+        shared.tag_index[shared.tags[index - 1]] = index - 1
         update_tags()
         return
 
@@ -95,11 +146,13 @@ def move_tag(tag: str, up: bool) -> None:
     if shared.tags[-1] == tag:
         return
 
-    index = shared.tags.index(tag)
+    index = shared.tag_index[tag]
 
     shared.tags[index], shared.tags[index + 1] = (
         shared.tags[index + 1],
         shared.tags[index],
     )
+    shared.tag_index[shared.tags[index]] = index
+    shared.tag_index[shared.tags[index + 1]] = index + 1
 
     update_tags()
@@ -36,6 +36,7 @@ from hyperplane.properties import HypPropertiesDialog
 from hyperplane.tag_row import HypTagRow
 from hyperplane.utils.create_alert_dialog import create_alert_dialog
 from hyperplane.utils.files import (
+    cached_is_dir,
     clear_recent_files,
     copy,
     empty_trash,
@@ -485,7 +486,7 @@ class HypWindow(Adw.ApplicationWindow):
                 .strip()
                 .replace("/", "⧸")
                 .replace("\n", " ")
-            ) in shared.tags:
+            ) in shared.tags_set:
                 self.send_toast(_("A category named “{}” already exists").format(text))
                 return
 
@@ -536,9 +537,11 @@ class HypWindow(Adw.ApplicationWindow):
 
     def __navigation_changed(self, view: Adw.NavigationView, *_args: Any) -> None:
         self.__hide_search_entry()
-        view.get_visible_page().item_filter.changed(Gtk.FilterChange.LESS_STRICT)
 
-        title = view.get_visible_page().get_title()
+        visible_page = view.get_visible_page()
+        visible_page.item_filter.changed(Gtk.FilterChange.LESS_STRICT)
+
+        title = visible_page.get_title()
 
         if page := self.tab_view.get_page(view.get_parent()):
             page.set_title(title)
@@ -756,26 +759,23 @@ class HypWindow(Adw.ApplicationWindow):
         self.__banner_button_callback()
 
     def __nav_stack_changed(self) -> None:
-        page = self.get_visible_page()
+        # Resolve the navigation bin once instead of walking
+        # the tab view's widget chain for every lookup
+        nav_bin = self.get_nav_bin()
+        page = nav_bin.view.get_visible_page()
 
         self.path_bar.update(page.gfile, page.tags)
 
         self.lookup_action("back").set_enabled(
-            bool(
-                self.tab_view.get_selected_page()
-                .get_child()
-                .view.get_navigation_stack()
-                .get_n_items()
-                - 1
-            )
+            bool(nav_bin.view.get_navigation_stack().get_n_items() - 1)
         )
-        self.lookup_action("forward").set_enabled(bool(self.get_nav_bin().next_pages))
+        self.lookup_action("forward").set_enabled(bool(nav_bin.next_pages))
 
         if not page.gfile:
             self.banner.set_revealed(False)
             return
 
-        match page.gfile.get_uri():
+        match page.uri:
             case SpecialUris.templates_uri:
                 self.banner.set_title(
                     "Put files in this folder to use them as templates for new files"
@@ -853,6 +853,7 @@ class HypWindow(Adw.ApplicationWindow):
                 'Cannot rename file "%s": %s', self.rename_item.gfile.get_uri(), error
             )
         else:
+            cached_is_dir.cache_clear()
             shared.undo_queue[time()] = ("rename", new_file, self.rename_item.edit_name)
 
     def __rename_popover_closed(self, *_args: Any) -> None:
@@ -953,31 +954,30 @@ class HypWindow(Adw.ApplicationWindow):
     def trash_pretty(self, *gfiles: Gio.File) -> None:
         """Trashes `gfiles` with the trash animation and a toast."""
 
-        gfiles = list(gfiles)
-
         files = []
-        n = 0
-        for gfile in gfiles.copy():
+        trashable = []
+        for gfile in gfiles:
             try:
                 files.append((get_gfile_path(gfile), int(time())))
             except FileNotFoundError:
                 logging.debug(
                     'Should not trash "%s": File has no path.', gfile.get_uri()
                 )
-                gfiles.remove(gfile)
                 continue
 
-        if not gfiles:
+            trashable.append(gfile)
+
+        if not trashable:
             return
 
-        trash(*gfiles)
+        trash(*trashable)
 
-        n = len(gfiles)
+        n = len(trashable)
         if n > 1:
             message = _("{} files moved to trash").format(n)
         else:
             message = _("{} moved to trash").format(
-                f"“{get_gfile_display_name(gfiles[0])}”"
+                f"“{get_gfile_display_name(trashable[0])}”"
             )
 
         toast = self.send_toast(message, do_undo=True)
@@ -997,7 +997,7 @@ class HypWindow(Adw.ApplicationWindow):
         page.multi_selection.unselect_all()
 
         if page.gfile:
-            if page.gfile.get_uri() == "trash:///":
+            if page.uri == SpecialUris.trash_uri:
                 if isinstance(value, Gdk.FileList):
                     for gfile in value:
                         if gfile.get_uri_scheme() == "trash":
@@ -1016,7 +1016,7 @@ class HypWindow(Adw.ApplicationWindow):
                 return False
 
         if isinstance(value, Gdk.FileList):
-            dst = self.get_visible_page().get_dst()
+            dst = page.get_dst()
             for src in value:
                 uri = src.get_uri()
 